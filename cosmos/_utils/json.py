@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    # orjson is faster than the standard library, but it is an optional dependency
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """
+    Deserialize a JSON document using orjson, if it is installed, or the standard library json module otherwise.
+
+    Documents that orjson rejects are parsed again using the standard library, which is more lenient. For instance,
+    dbt writes its artifacts using ``json.dumps``, which allows ``NaN`` and ``Infinity``, while orjson does not.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        # The standard library json module does not accept memory views
+        data = data.tobytes()
+    return json.loads(data)
+
+
+__all__ = ["ORJSON_AVAILABLE", "loads"]
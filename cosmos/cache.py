@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import functools
 import hashlib
 import json
+import mmap
 import os
 import shutil
+import sys
 import tempfile
 import time
 from collections import defaultdict
@@ -18,10 +19,11 @@ from airflow.models import DagRun, Variable
 from airflow.models.dag import DAG
 from airflow.utils.session import provide_session
 from airflow.version import version as airflow_version
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from cosmos import settings
+from cosmos._utils.json import loads as _json_loads
 
 if TYPE_CHECKING:
     try:
@@ -59,6 +61,8 @@ from cosmos.versioning import _create_folder_version_hash
 
 logger = get_logger(__name__)
 VAR_KEY_CACHE_PREFIX = "cosmos_cache__"
+# Linux ioctl request used to clone a file (reflink), from linux/fs.h
+FICLONE = 0x40049409
 
 
 def _configure_remote_cache_dir() -> Path | ObjectStoragePath | None:
@@ -176,10 +180,9 @@ def _get_timestamp(path: Path) -> float:
     :return: File or directory timestamp
     """
     try:
-        timestamp = path.stat().st_mtime
+        return os.stat(path).st_mtime
     except FileNotFoundError:
-        timestamp = 0
-    return timestamp
+        return 0
 
 
 def _get_latest_partial_parse(dbt_project_path: Path, cache_dir: Path) -> Path | None:
@@ -190,23 +193,39 @@ def _get_latest_partial_parse(dbt_project_path: Path, cache_dir: Path) -> Path |
     :param cache_dir: Path to the Cosmos project cache directory
     :return: Either return the Path to the latest partial parse file, or None.
     """
-    project_partial_parse_path = get_partial_parse_path(dbt_project_path)
-    cosmos_cached_partial_parse_filepath = get_partial_parse_path(cache_dir)
+    latest_partial_parse_filepath = None
+    latest_timestamp: float = 0
 
-    age_project_partial_parse = _get_timestamp(project_partial_parse_path)
-    age_cosmos_cached_partial_parse_filepath = _get_timestamp(cosmos_cached_partial_parse_filepath)
+    # The cached partial parse file is preferred if both have the same timestamp
+    for partial_parse_filepath in (get_partial_parse_path(cache_dir), get_partial_parse_path(dbt_project_path)):
+        timestamp = _get_timestamp(partial_parse_filepath)
+        if timestamp > latest_timestamp:
+            latest_partial_parse_filepath = partial_parse_filepath
+            latest_timestamp = timestamp
 
-    if age_project_partial_parse and age_cosmos_cached_partial_parse_filepath:
-        if age_project_partial_parse > age_cosmos_cached_partial_parse_filepath:
-            return project_partial_parse_path
-        else:
-            return cosmos_cached_partial_parse_filepath
-    elif age_project_partial_parse:
-        return project_partial_parse_path
-    elif age_cosmos_cached_partial_parse_filepath:
-        return cosmos_cached_partial_parse_filepath
+    return latest_partial_parse_filepath
 
-    return None
+
+def _copy_file(src: str, dst: str) -> None:
+    """
+    Copy the content of a file. On Linux, first try to clone it (reflink), which is a constant-time operation
+    on filesystems that support it, such as Btrfs and XFS. Otherwise, fallback to ``shutil.copyfile``, which
+    already uses ``os.sendfile`` on Linux.
+
+    :param src: Path to the source file
+    :param dst: Path to the destination file
+    """
+    if sys.platform == "linux":
+        # fcntl is not available on Windows
+        import fcntl
+
+        try:
+            with open(src, "rb") as src_fp, open(dst, "wb") as dst_fp:
+                fcntl.ioctl(dst_fp.fileno(), FICLONE, src_fp.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
 
 
 def _update_partial_parse_cache(latest_partial_parse_filepath: Path, cache_dir: Path) -> None:
@@ -218,11 +237,52 @@ def _update_partial_parse_cache(latest_partial_parse_filepath: Path, cache_dir:
     """
     cache_path = get_partial_parse_path(cache_dir)
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    manifest_path = get_partial_parse_path(cache_dir).parent / DBT_MANIFEST_FILE_NAME
+    manifest_path = cache_path.parent / DBT_MANIFEST_FILE_NAME
     latest_manifest_filepath = latest_partial_parse_filepath.parent / DBT_MANIFEST_FILE_NAME
 
-    shutil.copyfile(str(latest_partial_parse_filepath), str(cache_path))
-    shutil.copyfile(str(latest_manifest_filepath), str(manifest_path))
+    _copy_file(str(latest_partial_parse_filepath), str(cache_path))
+    _copy_file(str(latest_manifest_filepath), str(manifest_path))
+
+
+_PACKED_ROOT_PATH_KEY = msgpack.packb("root_path")
+# Maps the msgpack str8, str16 and str32 format markers to the size of their length field
+_MSGPACK_STR_LENGTH_SIZES = {0xD9: 1, 0xDA: 2, 0xDB: 4}
+
+
+def _has_stale_first_root_path(content: mmap.mmap) -> bool:
+    """
+    Check, without decoding the whole partial parse content, if the first root_path it contains may need patching.
+
+    Only the msgpack string that follows the first occurrence of the ``root_path`` key is decoded. If the key is
+    missing, or its value is an empty string or an existing path, there is nothing to patch. Otherwise (including when
+    the value is not a string), return True so the caller decodes the whole content.
+
+    :param content: Memory-mapped content of the partial parse file
+    :return: True if the partial parse content should be fully decoded to be patched, False otherwise
+    """
+    key_position = content.find(_PACKED_ROOT_PATH_KEY)
+    if key_position == -1:
+        return False
+
+    position = key_position + len(_PACKED_ROOT_PATH_KEY)
+    if position >= len(content):
+        return True
+    marker = content[position]
+    if 0xA0 <= marker <= 0xBF:  # fixstr
+        position += 1
+        length = marker & 0x1F
+    elif marker in _MSGPACK_STR_LENGTH_SIZES:
+        length_size = _MSGPACK_STR_LENGTH_SIZES[marker]
+        length = int.from_bytes(content[position + 1 : position + 1 + length_size], "big")
+        position += 1 + length_size
+    else:
+        return True
+
+    try:
+        root_path = content[position : position + length].decode()
+    except UnicodeDecodeError:
+        return True
+    return bool(root_path) and not Path(root_path).exists()
 
 
 def patch_partial_parse_content(partial_parse_filepath: Path, project_path: Path) -> bool:
@@ -243,26 +303,38 @@ def patch_partial_parse_content(partial_parse_filepath: Path, project_path: Path
     should_patch_partial_parse_content = False
 
     try:
-        with partial_parse_filepath.open("rb") as f:
+        # The file is memory-mapped to avoid copying its whole content into a bytes object before decoding it
+        with (
+            partial_parse_filepath.open("rb") as fp,
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
             # Issue reported: https://github.com/astronomer/astronomer-cosmos/issues/971
             # it may be due a race condition of multiple processes trying to read/write this file
-            data = msgpack.unpack(f)
+            if not _has_stale_first_root_path(mm):
+                return should_patch_partial_parse_content
+            # Arrays are decoded as tuples, which are smaller than lists and are packed back to the same format
+            data = msgpack.unpackb(mm, use_list=False)
     except ValueError as e:
         logger.info("Unable to patch the partial_parse.msgpack file due to %s" % repr(e))
     else:
-        for node in data["nodes"].values():
-            expected_filepath = node.get("root_path")
-            if expected_filepath is None:
-                continue
-            elif expected_filepath and not Path(expected_filepath).exists():
-                node["root_path"] = str(project_path)
-                should_patch_partial_parse_content = True
-            else:
-                break
+        # All the nodes of a partial parse file share the same root_path, so the first one is representative
+        first_root_path = next(
+            (node["root_path"] for node in data["nodes"].values() if node.get("root_path") is not None), None
+        )
+        if first_root_path and not Path(first_root_path).exists():
+            new_root_path = str(project_path)
+            for node in data["nodes"].values():
+                if node.get("root_path"):
+                    node["root_path"] = new_root_path
+            should_patch_partial_parse_content = True
         if should_patch_partial_parse_content:
-            with partial_parse_filepath.open("wb") as f:
+            # Write to a temporary file and atomically replace the original one, so concurrent readers
+            # never see a partially written file
+            temp_fd, temp_path = tempfile.mkstemp(dir=partial_parse_filepath.parent)
+            with os.fdopen(temp_fd, "wb") as f:
                 packed = msgpack.packb(data)
                 f.write(packed)
+            os.replace(temp_path, partial_parse_filepath)
     return should_patch_partial_parse_content
 
 
@@ -279,12 +351,14 @@ def _copy_partial_parse_to_project(partial_parse_filepath: Path, project_path: P
 
     source_manifest_filepath = partial_parse_filepath.parent / DBT_MANIFEST_FILE_NAME
     target_manifest_filepath = target_partial_parse_file.parent / DBT_MANIFEST_FILE_NAME
-    shutil.copy(str(partial_parse_filepath), str(target_partial_parse_file))
+    _copy_file(str(partial_parse_filepath), str(target_partial_parse_file))
 
     patch_partial_parse_content(target_partial_parse_file, project_path)
 
-    if source_manifest_filepath.exists():
-        shutil.copy(str(source_manifest_filepath), str(target_manifest_filepath))
+    try:
+        _copy_file(str(source_manifest_filepath), str(target_manifest_filepath))
+    except FileNotFoundError:
+        logger.debug(f"There is no manifest to be copied from {source_manifest_filepath}")
 
 
 def _calculate_dbt_ls_cache_current_version(cache_identifier: str, project_dir: Path, cmd_args: list[str]) -> str:
@@ -300,10 +374,14 @@ def _calculate_dbt_ls_cache_current_version(cache_identifier: str, project_dir:
 
     # Combined value for when the dbt project directory files were last modified
     # This is fast (e.g. 0.01s for jaffle shop, 0.135s for a 5k models dbt folder)
-    dbt_project_hash = _create_folder_version_hash(project_dir)
+    dbt_project_hash = _create_folder_version_hash(project_dir, index_dir=cache_dir)
 
     # The performance for the following will depend on the user's configuration
-    hash_args = hashlib.md5("".join(cmd_args).encode()).hexdigest()
+    # Feeding the arguments one by one results in the same hash as their concatenation, without building it
+    args_hasher = hashlib.md5()
+    for arg in cmd_args:
+        args_hasher.update(arg.encode())
+    hash_args = args_hasher.hexdigest()
 
     elapsed_time = time.perf_counter() - start_time
     logger.info(
@@ -312,7 +390,6 @@ def _calculate_dbt_ls_cache_current_version(cache_identifier: str, project_dir:
     return f"{dbt_project_hash},{hash_args}"
 
 
-@functools.lru_cache
 def was_project_modified(previous_version: str, current_version: str) -> bool:
     """
     Given the cache version of a project and the latest version of the project,
@@ -321,6 +398,56 @@ def was_project_modified(previous_version: str, current_version: str) -> bool:
     return previous_version != current_version
 
 
+def _get_last_execution_dates(session: Session, dag_ids: list[str]) -> dict[str, datetime]:
+    """
+    Return the execution date of the latest DAG run of each of the given DAGs, using a single query.
+    DAGs that were never run are not included.
+
+    :param session: Airflow metadata database session
+    :param dag_ids: Identifiers of the DAGs of interest
+    :return: Dictionary mapping the DAG identifier to the execution date of its latest DAG run
+    """
+    if not dag_ids:
+        return {}
+    rows = session.execute(
+        select(DagRun.dag_id, func.max(DagRun.execution_date)).where(DagRun.dag_id.in_(dag_ids)).group_by(DagRun.dag_id)
+    ).all()
+    return {dag_id: last_execution_date for dag_id, last_execution_date in rows}
+
+
+def _get_cosmos_cache_keys_by_dag_id(session: Session) -> dict[str, list[str]]:
+    """
+    Return the keys of the Airflow Variables used to store Cosmos cache, grouped by the DAG they relate to.
+
+    The key prefix is filtered by the database, escaping the underscores, so unrelated Variables are not loaded.
+    When the cache identifier does not contain ``__``, it is the identifier of a ``DbtDag`` whose ``dag_id`` has no
+    dots, so it is used as the ``dag_id`` without loading the (potentially large) Variable value. Otherwise, since the
+    identifier could be ambiguous, the ``dag_id`` is read from the Variable value.
+
+    :param session: Airflow metadata database session
+    :return: Dictionary mapping the DAG identifier to the keys of the Variables storing its cache
+    """
+    cosmos_dags_ids = defaultdict(list)
+    keys_to_load = []
+
+    cosmos_variables_keys = session.scalars(
+        select(Variable.key).where(Variable.key.startswith(VAR_KEY_CACHE_PREFIX, autoescape=True))
+    ).all()
+    for var_key in cosmos_variables_keys:
+        cache_identifier = var_key[len(VAR_KEY_CACHE_PREFIX) :]
+        if "__" in cache_identifier:
+            keys_to_load.append(var_key)
+        else:
+            cosmos_dags_ids[cache_identifier].append(var_key)
+
+    if keys_to_load:
+        for var in session.scalars(select(Variable).where(Variable.key.in_(keys_to_load))):
+            var_value = _json_loads(var.val)
+            cosmos_dags_ids[var_value["dag_id"]].append(var.key)
+
+    return cosmos_dags_ids
+
+
 @provide_session
 def delete_unused_dbt_ls_cache(
     max_age_last_usage: timedelta = timedelta(days=30), session: Session | None = None
@@ -366,33 +493,25 @@ def delete_unused_dbt_ls_cache(
         return 0
 
     logger.info(f"Delete the Cosmos cache stored in Airflow Variables that hasn't been used for  {max_age_last_usage}")
-    cosmos_dags_ids = defaultdict(list)
-    all_variables = session.scalars(select(Variable)).all()
-    total_cosmos_variables = 0
-    deleted_cosmos_variables = 0
-
     # Identify Cosmos-related cache in Airflow variables
-    for var in all_variables:
-        if var.key.startswith(VAR_KEY_CACHE_PREFIX):
-            var_value = json.loads(var.val)
-            cosmos_dags_ids[var_value["dag_id"]].append(var.key)
-            total_cosmos_variables += 1
+    cosmos_dags_ids = _get_cosmos_cache_keys_by_dag_id(session)
+    total_cosmos_variables = sum(len(vars_keys) for vars_keys in cosmos_dags_ids.values())
+    deleted_cosmos_variables = 0
 
     # Delete DAGs that have not been run in the last X time
+    last_execution_dates = _get_last_execution_dates(session, list(cosmos_dags_ids))
+    vars_keys_to_delete = []
     for dag_id, vars_keys in cosmos_dags_ids.items():
-        last_dag_run = (
-            session.query(DagRun)
-            .filter(
-                DagRun.dag_id == dag_id,
-            )
-            .order_by(DagRun.execution_date.desc())
-            .first()
-        )
-        if last_dag_run and last_dag_run.execution_date < (datetime.now(timezone.utc) - max_age_last_usage):
+        last_execution_date = last_execution_dates.get(dag_id)
+        if last_execution_date and last_execution_date < (datetime.now(timezone.utc) - max_age_last_usage):
             for var_key in vars_keys:
                 logger.info(f"Removing the dbt ls cache {var_key}")
-                Variable.delete(var_key)
-                deleted_cosmos_variables += 1
+                vars_keys_to_delete.append(var_key)
+
+    if vars_keys_to_delete:
+        session.execute(delete(Variable).where(Variable.key.in_(vars_keys_to_delete)))
+        session.commit()
+        deleted_cosmos_variables = len(vars_keys_to_delete)
 
     logger.info(
         f"Deleted {deleted_cosmos_variables}/{total_cosmos_variables} Airflow Variables used to store  Cosmos cache. "
@@ -435,16 +554,10 @@ def delete_unused_dbt_ls_remote_cache_files(  # pragma: no cover
 
     deleted_cosmos_remote_cache_files = 0
 
+    last_execution_dates = _get_last_execution_dates(session, list(cosmos_dags_ids_remote_cache_files))
     for dag_id, files in cosmos_dags_ids_remote_cache_files.items():
-        last_dag_run = (
-            session.query(DagRun)
-            .filter(
-                DagRun.dag_id == dag_id,
-            )
-            .order_by(DagRun.execution_date.desc())
-            .first()
-        )
-        if last_dag_run and last_dag_run.execution_date < (datetime.now(timezone.utc) - max_age_last_usage):
+        last_execution_date = last_execution_dates.get(dag_id)
+        if last_execution_date and last_execution_date < (datetime.now(timezone.utc) - max_age_last_usage):
             for file in files:
                 logger.info(f"Removing the dbt ls cache remote file {file}")
                 file.unlink()
@@ -28,6 +28,7 @@ DBT_BINARY_NAME = "dbt"
 DEFAULT_PROFILES_FILE_NAME = "profiles.yml"
 PACKAGE_LOCKFILE_YML = "package-lock.yml"
 DBT_DEFAULT_PACKAGES_FOLDER = "dbt_packages"
+DEFAULT_DBT_PROJECT_HASH_EXCLUDED_DIRS = ".git,.venv,__pycache__,dbt_packages,logs,target"
 
 DEFAULT_OPENLINEAGE_NAMESPACE = "cosmos"
 OPENLINEAGE_PRODUCER = "https://github.com/astronomer/astronomer-cosmos/"
@@ -1,23 +1,34 @@
 from __future__ import annotations
 
 import base64
+import copy
 import datetime
 import functools
 import itertools
 import json
+import logging
+import mmap
 import os
 import platform
+import sys
 import tempfile
 import warnings
 import zlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
 from subprocess import PIPE, Popen
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from airflow.models import Variable
 
+try:
+    # zstandard compresses and decompresses faster than zlib, but it is an optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     try:
         # Airflow 3 onwards
@@ -30,6 +41,8 @@ if TYPE_CHECKING:
 
 import cosmos.dbt.runner as dbt_runner
 from cosmos import cache, settings
+from cosmos._utils.json import ORJSON_AVAILABLE
+from cosmos._utils.json import loads as _json_loads
 from cosmos.cache import (
     _configure_remote_cache_dir,
     _copy_cached_package_lockfile_to_project,
@@ -62,6 +75,45 @@ from cosmos.log import get_logger
 
 logger = get_logger(__name__)
 
+DBT_LS_COMPRESSION_ZLIB = "zlib"
+DBT_LS_COMPRESSION_ZSTD = "zstd"
+DBT_LS_ZSTD_LEVEL = 3
+# Key of the compressed dbt ls output in the cache, given the compression algorithm. The zstd output has its own key, so
+# Cosmos versions that only support zlib find no output in the cache and recreate it, instead of failing to decompress it
+DBT_LS_CACHE_KEYS = {
+    DBT_LS_COMPRESSION_ZLIB: "dbt_ls_compressed",
+    DBT_LS_COMPRESSION_ZSTD: "dbt_ls_compressed_zstd",
+}
+
+
+def _compress_dbt_ls_output(dbt_ls_output: str) -> tuple[bytes, str]:
+    """
+    Compress the dbt ls output using zstd, if zstandard is installed, or zlib otherwise.
+
+    :returns: A tuple containing the compressed output and the name of the compression algorithm used
+    """
+    if zstandard is not None:
+        return (
+            zstandard.ZstdCompressor(level=DBT_LS_ZSTD_LEVEL).compress(dbt_ls_output.encode("utf-8")),
+            DBT_LS_COMPRESSION_ZSTD,
+        )
+    return zlib.compress(dbt_ls_output.encode("utf-8")), DBT_LS_COMPRESSION_ZLIB
+
+
+def _decompress_dbt_ls_output(compressed_data: bytes, compression: str) -> str | None:
+    """
+    Decompress the dbt ls output, given the name of the compression algorithm used to compress it.
+
+    :returns: The dbt ls output, or None if it was compressed using zstd and zstandard is not installed
+    """
+    if compression == DBT_LS_COMPRESSION_ZSTD:
+        if zstandard is None:
+            logger.info("Unable to decompress the dbt ls cache, since it uses zstd and zstandard is not installed")
+            return None
+        decompressed_data: bytes = zstandard.ZstdDecompressor().decompress(compressed_data)
+        return decompressed_data.decode()
+    return zlib.decompress(compressed_data).decode()
+
 
 def _normalize_path(path: str) -> str:
     """
@@ -78,10 +130,12 @@ class CosmosLoadDbtException(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DbtNode:
     """
     Metadata related to a dbt node (e.g. model, seed, snapshot, source).
+
+    Instances use ``__slots__``, since large dbt projects can have thousands of nodes.
     """
 
     unique_id: str
@@ -95,6 +149,9 @@ class DbtNode:
     has_test: bool = False
     has_non_detached_test: bool = False
     downstream: list[str] = field(default_factory=lambda: [])
+    # Derived from the unique_id on first access, since they are read many times while rendering the DAG
+    _resource_name: str | None = field(default=None, init=False, repr=False, compare=False)
+    _name: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def meta(self) -> dict[str, Any]:
@@ -150,7 +207,9 @@ class DbtNode:
         The unique_id format is defined as [<resource_type>.<package>.<resource_name>](https://docs.getdbt.com/reference/artifacts/manifest-json#resource-details).
         For a special case like a versioned model, the unique_id follows this pattern: [model.<package>.<resource_name>.<version>](https://github.com/dbt-labs/dbt-core/blob/main/core/dbt/contracts/graph/node_args.py#L26C3-L31)
         """
-        return self.unique_id.split(".", 2)[2]
+        if self._resource_name is None:
+            self._resource_name = self.unique_id.split(".", 2)[2]
+        return self._resource_name
 
     @property
     def name(self) -> str:
@@ -158,7 +217,9 @@ class DbtNode:
         Use this property as the task name or task group name.
         Replace period (.) with underscore (_) due to versioned models.
         """
-        return self.resource_name.replace(".", "_")
+        if self._name is None:
+            self._name = self.resource_name.replace(".", "_")
+        return self._name
 
     @property
     def owner(self) -> str:
@@ -186,6 +247,24 @@ class DbtNode:
         }
 
 
+@functools.cache
+def _get_dbt_resource_type(value: str) -> DbtResourceType:
+    """
+    Return the ``DbtResourceType`` member of the given value, avoiding the cost of the enum lookup for every node.
+    ``DbtResourceType`` is extended with unknown values (e.g. "unit_test") on their first lookup, which is permanent,
+    so the members can be cached for the lifetime of the process.
+    """
+    return DbtResourceType(value)
+
+
+def _intern_strings(values: list[str]) -> list[str]:
+    """
+    Intern the given strings, which are repeated across many dbt nodes (e.g. tags and the ids of the nodes they depend
+    on), so each distinct value is stored only once.
+    """
+    return [sys.intern(value) for value in values]
+
+
 def is_freshness_effective(freshness: dict[str, Any] | None) -> bool:
     """Function to find if a source has null freshness. Scenarios where freshness
     looks like:
@@ -228,7 +307,8 @@ def run_command_with_subprocess(command: list[str], tmp_dir: Path, env_vars: dic
             "Unable to run dbt ls command due to missing dbt_packages. Set RenderConfig.dbt_deps=True."
         )
 
-    if returncode or "Error" in stdout.replace("WarnErrorOptions", ""):
+    # Counting the occurrences avoids copying the (potentially large) output to remove the "WarnErrorOptions" ones
+    if returncode or stdout.count("Error") > stdout.count("WarnErrorOptions"):
         details = f"stderr: {stderr}\nstdout: {stdout}"
         raise CosmosLoadDbtException(f"Unable to run {command} due to the error:\n{details}")
 
@@ -291,7 +371,8 @@ def run_command(
 
     logger.debug("dbt ls output: %s", stdout)
 
-    if log_dir is not None:
+    # The dbt log file can be large, so it is only read if it is going to be logged
+    if log_dir is not None and logger.isEnabledFor(logging.DEBUG):
         log_filepath = log_dir / DBT_LOG_FILENAME
         logger.debug("dbt logs available in: %s", log_filepath)
         if log_filepath.exists():
@@ -302,41 +383,127 @@ def run_command(
     return stdout
 
 
+def _parse_dbt_ls_json_lines(ls_stdout: str) -> list[tuple[str, Any]]:
+    """
+    Parse the lines of the `dbt ls` output that contain JSON objects, skipping the remaining ones (e.g. logs).
+
+    :returns: A list of tuples containing each JSON line and its parsed value
+    """
+    lines = []
+    for line in ls_stdout.split("\n"):
+        line = line.strip()
+        # Log lines are skipped without trying to parse them, since raising an exception per line is costly
+        if line.startswith("{"):
+            lines.append(line)
+        else:
+            logger.debug("Skipped dbt ls line: %s", line)
+
+    # Parsing all the lines at once, as a single JSON array, is faster than parsing them one by one
+    try:
+        values = _json_loads("[" + ",".join(lines) + "]")
+    except ValueError:
+        values = None
+    if values is not None and len(values) == len(lines):
+        return list(zip(lines, values))
+
+    # At least one of the lines is not a valid JSON object, so each line is parsed individually
+    json_lines = []
+    for line in lines:
+        try:
+            json_lines.append((line, _json_loads(line)))
+        except ValueError:
+            logger.debug("Skipped dbt ls line: %s", line)
+    return json_lines
+
+
 def parse_dbt_ls_output(project_path: Path | None, ls_stdout: str) -> dict[str, DbtNode]:
     """Parses the output of `dbt ls` into a dictionary of `DbtNode` instances."""
     nodes = {}
-    for line in ls_stdout.split("\n"):
+    # Base path of the nodes of each package, so it is not created again for every node
+    package_paths: dict[str, Path] = {}
+    for line, node_dict in _parse_dbt_ls_json_lines(ls_stdout):
+        package_name = node_dict.get("package_name")
+        base_path: Path = project_path  # type: ignore[assignment]
+        if package_name:
+            if package_name not in package_paths:
+                package_paths[package_name] = base_path.parent / package_name
+            base_path = package_paths[package_name]
+
         try:
-            node_dict = json.loads(line.strip())
-        except json.decoder.JSONDecodeError:
-            logger.debug("Skipped dbt ls line: %s", line)
-        else:
-            base_path = (
-                project_path.parent / node_dict["package_name"] if node_dict.get("package_name") else project_path  # type: ignore
+            resource_type = _get_dbt_resource_type(node_dict["resource_type"])
+            node = DbtNode(
+                unique_id=sys.intern(node_dict["unique_id"]),
+                package_name=node_dict.get("package_name"),
+                resource_type=resource_type,
+                depends_on=_intern_strings(node_dict.get("depends_on", {}).get("nodes", [])),
+                # dbt-core defined the node path via "original_file_path", dbt fusion identifies it via "path"
+                file_path=base_path / (node_dict["original_file_path"] or node_dict.get("path")),
+                tags=_intern_strings(node_dict.get("tags") or []),
+                config=node_dict.get("config") or {},
+                has_freshness=(
+                    is_freshness_effective(node_dict.get("freshness"))
+                    if resource_type == DbtResourceType.SOURCE
+                    else False
+                ),
             )
+        except KeyError:
+            logger.info("Could not parse following the dbt ls line even though it was a valid JSON `%s`", line)
+        else:
+            nodes[node.unique_id] = node
+            logger.debug("Parsed dbt resource `%s` of type `%s`", node.unique_id, node.resource_type)
+    return nodes
+
 
+def _load_json_file(path: Path | ObjectStoragePath) -> Any:
+    """
+    Load the content of a JSON file (e.g. manifest.json). When orjson is installed, local files are memory-mapped, so
+    their content is parsed without being copied into memory beforehand.
+    """
+    with path.open("rb") as fp:
+        # The standard library json module does not accept memory views
+        if ORJSON_AVAILABLE:
             try:
-                node = DbtNode(
-                    unique_id=node_dict["unique_id"],
-                    package_name=node_dict.get("package_name"),
-                    resource_type=DbtResourceType(node_dict["resource_type"]),
-                    depends_on=node_dict.get("depends_on", {}).get("nodes", []),
-                    # dbt-core defined the node path via "original_file_path", dbt fusion identifies it via "path"
-                    file_path=base_path / (node_dict["original_file_path"] or node_dict.get("path")),
-                    tags=node_dict.get("tags") or [],
-                    config=node_dict.get("config") or {},
-                    has_freshness=(
-                        is_freshness_effective(node_dict.get("freshness"))
-                        if DbtResourceType(node_dict["resource_type"]) == DbtResourceType.SOURCE
-                        else False
-                    ),
-                )
-            except KeyError:
-                logger.info("Could not parse following the dbt ls line even though it was a valid JSON `%s`", line)
+                content = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError):
+                # Remote (e.g. ObjectStoragePath) and empty files cannot be memory-mapped
+                pass
             else:
-                nodes[node.unique_id] = node
-                logger.debug("Parsed dbt resource `%s` of type `%s`", node.unique_id, node.resource_type)
-    return nodes
+                with content, memoryview(content) as view:
+                    return _json_loads(view)
+        return _json_loads(fp.read())
+
+
+PARSED_DBT_LS_CACHE_MAX_SIZE = 8
+
+# Nodes parsed from the dbt ls cache by this process, indexed by the project path and the dbt ls output
+_parsed_dbt_ls_cache: OrderedDict[tuple[str, str], dict[str, DbtNode]] = OrderedDict()
+
+
+def _parse_dbt_ls_cache_output(project_path: Path, dbt_ls_output: str) -> dict[str, DbtNode]:
+    """
+    Parse the dbt ls output retrieved from the cache, reusing the nodes previously parsed by the current process for
+    the same project and output. This avoids parsing the same output once per DAG, when many DAGs share a dbt project.
+
+    Each call returns new ``DbtNode`` instances, since these are changed while loading the ``DbtGraph`` (e.g.
+    ``has_test`` and ``downstream``).
+    """
+    key = (str(project_path), dbt_ls_output)
+    nodes = _parsed_dbt_ls_cache.get(key)
+    if nodes is None:
+        nodes = parse_dbt_ls_output(project_path=project_path, ls_stdout=dbt_ls_output)
+        _parsed_dbt_ls_cache[key] = nodes
+        if len(_parsed_dbt_ls_cache) > PARSED_DBT_LS_CACHE_MAX_SIZE:
+            _parsed_dbt_ls_cache.popitem(last=False)
+    else:
+        _parsed_dbt_ls_cache.move_to_end(key)
+        logger.debug(f"Reusing the nodes previously parsed from the dbt ls cache of {project_path}")
+
+    copied_nodes = {}
+    for unique_id, node in nodes.items():
+        copied_node = copy.copy(node)
+        copied_node.downstream = list(node.downstream)
+        copied_nodes[unique_id] = copied_node
+    return copied_nodes
 
 
 class DbtGraph:
@@ -360,6 +527,15 @@ class DbtGraph:
     filtered_nodes: dict[str, DbtNode] = dict()
     load_method: LoadMode = LoadMode.AUTOMATIC
 
+    # Name of the method used by each explicit LoadMode, resolved when loading so it respects subclasses
+    _LOAD_METHODS: ClassVar[dict[LoadMode, str]] = {
+        LoadMode.CUSTOM: "load_via_custom_parser",
+        LoadMode.DBT_LS: "load_via_dbt_ls",
+        LoadMode.DBT_LS_FILE: "load_via_dbt_ls_file",
+        LoadMode.DBT_LS_CACHE: "load_via_dbt_ls_cache",
+        LoadMode.DBT_MANIFEST: "load_from_dbt_manifest",
+    }
+
     def __init__(
         self,
         project: ProjectConfig,
@@ -410,12 +586,26 @@ class DbtGraph:
             )
         return path.absolute()
 
+    @cached_property
+    def _dbt_vars_json(self) -> str:
+        """
+        dbt vars serialised as JSON, as expected by the ``--vars`` flag of both dbt ls and dbt deps.
+        """
+        return json.dumps(self.dbt_vars, sort_keys=True)
+
+    @cached_property
+    def _env_vars_json(self) -> str:
+        """
+        User-defined environment variables serialised as JSON, or an empty string if there are none.
+        """
+        return json.dumps(self.env_vars, sort_keys=True) if self.env_vars else ""
+
     def _add_vars_arg(self, cmd_args: list[str]) -> None:
         """
         Change args list in-place so they include dbt vars, if they are set.
         """
         if self.dbt_vars:
-            cmd_args.extend(["--vars", json.dumps(self.dbt_vars, sort_keys=True)])
+            cmd_args.extend(["--vars", self._dbt_vars_json])
 
     @cached_property
     def dbt_ls_args(self) -> list[str]:
@@ -447,18 +637,34 @@ class DbtGraph:
         """
         # if dbt deps, we can consider the md5 of the packages or deps file
         cache_args = list(self.dbt_ls_args)
-        env_vars = self.env_vars
-        if env_vars:
-            envvars_str = json.dumps(env_vars, sort_keys=True)
-            cache_args.append(envvars_str)
+        if self._env_vars_json:
+            cache_args.append(self._env_vars_json)
         if self.render_config.airflow_vars_to_purge_dbt_ls_cache:
+            # Variable.get is used instead of querying the metadata database at once, so variables defined in secrets
+            # backends (e.g. environment variables) are respected, as well as the Airflow 3 Task SDK. Each variable is
+            # retrieved only once, even if it is listed more than once.
+            airflow_vars: dict[str, str] = {}
             for var_name in self.render_config.airflow_vars_to_purge_dbt_ls_cache:
-                airflow_vars = [var_name, Variable.get(var_name, "")]
-                cache_args.extend(airflow_vars)
+                if var_name not in airflow_vars:
+                    airflow_vars[var_name] = Variable.get(var_name, "")
+                cache_args.extend([var_name, airflow_vars[var_name]])
 
         logger.debug(f"Value of `dbt_ls_cache_key_args` for <{self.dbt_ls_cache_key}>: {cache_args}")
         return cache_args
 
+    @cached_property
+    def _current_cache_version(self) -> str:
+        """
+        Version of the dbt project and dbt ls arguments, used to validate the dbt ls cache. It is calculated once per
+        instance, since both loading and storing the dbt ls cache need it, and it requires hashing the dbt project.
+
+        If the dbt project changes after this is calculated, the stored cache will not match the following version,
+        so it is recreated.
+        """
+        return cache._calculate_dbt_ls_cache_current_version(
+            self.dbt_ls_cache_key, self.project_path, self.dbt_ls_cache_key_args
+        )
+
     def save_dbt_ls_cache(self, dbt_ls_output: str) -> None:
         """
         Store compressed dbt ls output into an Airflow Variable.
@@ -466,19 +672,18 @@ class DbtGraph:
         Stores:
         {
             "version": "cache-version",
-            "dbt_ls_compressed": "compressed dbt ls output",
+            "dbt_ls_compressed" or "dbt_ls_compressed_zstd": "compressed dbt ls output",
             "last_modified": "Isoformat timestamp"
         }
         """
         # This compression reduces the dbt ls output to 10% of the original size
-        compressed_data = zlib.compress(dbt_ls_output.encode("utf-8"))
-        encoded_data = base64.b64encode(compressed_data)
-        dbt_ls_compressed = encoded_data.decode("utf-8")
+        compressed_data, compression = _compress_dbt_ls_output(dbt_ls_output)
+        # Base64 is kept, since the cache is stored as JSON: a latin-1 or hex string would take more space, given that
+        # json.dumps escapes non-ASCII characters (6 bytes each) and hex doubles the size, while base64 adds only 33%
+        dbt_ls_compressed = base64.b64encode(compressed_data).decode("ascii")
         cache_dict = {
-            "version": cache._calculate_dbt_ls_cache_current_version(
-                self.dbt_ls_cache_key, self.project_path, self.dbt_ls_cache_key_args
-            ),
-            "dbt_ls_compressed": dbt_ls_compressed,
+            "version": self._current_cache_version,
+            DBT_LS_CACHE_KEYS[compression]: dbt_ls_compressed,
             "last_modified": datetime.datetime.now(datetime.timezone.utc).isoformat(),
             **self.airflow_metadata,
         }
@@ -530,10 +735,14 @@ class DbtGraph:
         except tuple(airflow_variable_exceptions):
             return cache_dict
         else:
-            dbt_ls_compressed = cache_dict.pop("dbt_ls_compressed", None)
-            if dbt_ls_compressed:
-                encoded_data = base64.b64decode(dbt_ls_compressed.encode())
-                cache_dict["dbt_ls"] = zlib.decompress(encoded_data).decode()
+            for compression, key in DBT_LS_CACHE_KEYS.items():
+                dbt_ls_compressed = cache_dict.pop(key, None)
+                if dbt_ls_compressed:
+                    # b64decode accepts ASCII strings, so there is no need to encode the value beforehand
+                    compressed_data = base64.b64decode(dbt_ls_compressed)
+                    dbt_ls = _decompress_dbt_ls_output(compressed_data, compression)
+                    if dbt_ls is not None:
+                        cache_dict["dbt_ls"] = dbt_ls
 
         return cache_dict
 
@@ -552,14 +761,6 @@ class DbtGraph:
         Fundamentally, there are two different execution paths
         There is automatic, and manual.
         """
-        load_method = {
-            LoadMode.CUSTOM: self.load_via_custom_parser,
-            LoadMode.DBT_LS: self.load_via_dbt_ls,
-            LoadMode.DBT_LS_FILE: self.load_via_dbt_ls_file,
-            LoadMode.DBT_LS_CACHE: self.load_via_dbt_ls_cache,
-            LoadMode.DBT_MANIFEST: self.load_from_dbt_manifest,
-        }
-
         if method == LoadMode.AUTOMATIC:
             if self.project.is_manifest_available():
                 self.load_from_dbt_manifest()
@@ -572,7 +773,7 @@ class DbtGraph:
                 else:
                     self.load_via_custom_parser()
         else:
-            load_method[method]()
+            getattr(self, self._LOAD_METHODS[method])()
 
         self.update_node_dependency()
 
@@ -633,7 +834,6 @@ class DbtGraph:
         if not self.load_via_dbt_ls_cache():
             self.load_via_dbt_ls_without_cache()
 
-    @functools.lru_cache
     def should_use_dbt_ls_cache(self) -> bool:
         """Identify if Cosmos should use/store dbt ls cache or not."""
         return settings.enable_cache and settings.enable_cache_dbt_ls and bool(self.dbt_ls_cache_key)
@@ -652,17 +852,15 @@ class DbtGraph:
             cache_version = cache_dict.get("version")
             dbt_ls_cache = cache_dict.get("dbt_ls")
 
-            current_version = cache._calculate_dbt_ls_cache_current_version(
-                self.dbt_ls_cache_key, project_path, self.dbt_ls_cache_key_args
-            )
+            current_version = self._current_cache_version
 
-            if dbt_ls_cache and not cache.was_project_modified(cache_version, current_version):
+            if dbt_ls_cache and cache_version == current_version:
                 logger.info(
                     f"Cosmos performance [{platform.node()}|{os.getpid()}]: The cache size for {self.dbt_ls_cache_key} is {len(dbt_ls_cache)}"
                 )
                 self.load_method = LoadMode.DBT_LS_CACHE
 
-                nodes = parse_dbt_ls_output(project_path=project_path, ls_stdout=dbt_ls_cache)
+                nodes = _parse_dbt_ls_cache_output(project_path=project_path, dbt_ls_output=dbt_ls_cache)
                 self.nodes = nodes
                 self.filtered_nodes = nodes
                 logger.info(f"Cosmos performance: Cache hit for {self.dbt_ls_cache_key} - {current_version}")
@@ -881,18 +1079,17 @@ class DbtGraph:
         models = itertools.chain(
             project.models.items(), project.snapshots.items(), project.seeds.items(), project.tests.items()
         )
+        render_project_path = self.render_config.project_path.as_posix()
+        execution_project_path = self.execution_config.project_path.as_posix()
         for model_name, model in models:
-            config = {item.split(":")[0]: item.split(":")[-1] for item in model.config.config_selectors}
+            # Equivalent to {item.split(":")[0]: item.split(":")[-1]}, without splitting each item twice
+            config = {item.partition(":")[0]: item.rpartition(":")[2] for item in model.config.config_selectors}
             tags = [selector for selector in model.config.config_selectors if selector.startswith("tags:")]
             node = DbtNode(
                 unique_id=f"{model.type.value}.{self.project.project_name}.{model_name}",
-                resource_type=DbtResourceType(model.type.value),
+                resource_type=_get_dbt_resource_type(model.type.value),
                 depends_on=list(model.config.upstream_models),
-                file_path=Path(
-                    model.path.as_posix().replace(
-                        self.render_config.project_path.as_posix(), self.execution_config.project_path.as_posix()
-                    )
-                ),
+                file_path=Path(model.path.as_posix().replace(render_project_path, execution_project_path)),
                 tags=tags or [],
                 config=config,
             )
@@ -936,36 +1133,43 @@ class DbtGraph:
         if TYPE_CHECKING:
             assert self.project.manifest_path is not None  # pragma: no cover
 
-        with self.project.manifest_path.open() as fp:
-            manifest = json.load(fp)
-
-            resources = {**manifest.get("nodes", {}), **manifest.get("sources", {}), **manifest.get("exposures", {})}
-            for unique_id, node_dict in resources.items():
-                node = DbtNode(
-                    unique_id=unique_id,
-                    package_name=node_dict.get("package_name"),
-                    resource_type=DbtResourceType(node_dict["resource_type"]),
-                    depends_on=node_dict.get("depends_on", {}).get("nodes", []),
-                    file_path=self.execution_config.project_path / _normalize_path(node_dict["original_file_path"]),
-                    tags=node_dict.get("tags") or [],
-                    config=node_dict.get("config") or {},
-                    has_freshness=(
-                        is_freshness_effective(node_dict.get("freshness"))
-                        if DbtResourceType(node_dict["resource_type"]) == DbtResourceType.SOURCE
-                        else False
-                    ),
-                )
-
-                nodes[node.unique_id] = node
+        manifest = _load_json_file(self.project.manifest_path)
 
-            self.nodes = nodes
-            self.filtered_nodes = select_nodes(
-                project_dir=self.execution_config.project_path,
-                nodes=nodes,
-                select=self.render_config.select,
-                exclude=self.render_config.exclude,
+        project_path = self.execution_config.project_path
+        # The resources are iterated without merging them into a new dictionary, which is costly for large manifests
+        resources = itertools.chain(
+            manifest.get("nodes", {}).items(),
+            manifest.get("sources", {}).items(),
+            manifest.get("exposures", {}).items(),
+        )
+        for unique_id, node_dict in resources:
+            resource_type = _get_dbt_resource_type(node_dict["resource_type"])
+            node = DbtNode(
+                unique_id=sys.intern(unique_id),
+                package_name=node_dict.get("package_name"),
+                resource_type=resource_type,
+                depends_on=_intern_strings(node_dict.get("depends_on", {}).get("nodes", [])),
+                # Equivalent to _normalize_path, since joining paths also normalises them, without creating another Path
+                file_path=project_path / node_dict["original_file_path"].replace("\\", "/"),
+                tags=_intern_strings(node_dict.get("tags") or []),
+                config=node_dict.get("config") or {},
+                has_freshness=(
+                    is_freshness_effective(node_dict.get("freshness"))
+                    if resource_type == DbtResourceType.SOURCE
+                    else False
+                ),
             )
 
+            nodes[node.unique_id] = node
+
+        self.nodes = nodes
+        self.filtered_nodes = select_nodes(
+            project_dir=project_path,
+            nodes=nodes,
+            select=self.render_config.select,
+            exclude=self.render_config.exclude,
+        )
+
     def update_node_dependency(self) -> None:
         """
         This will update the property `has_test` if node has `dbt` test and update the property
@@ -974,19 +1178,30 @@ class DbtGraph:
         Updates in-place:
         * self.filtered_nodes
         """
-        for _, node in list(self.nodes.items()):
+        filtered_nodes = self.filtered_nodes
+        detach_multiple_parents_tests = self.render_config.should_detach_multiple_parents_tests is not False
+        # Reverse index from each tested node to whether at least one of its tests is non-detached
+        non_detached_test_by_tested_node: dict[str, bool] = {}
+        # No copy of the nodes is needed: the only keys set in filtered_nodes while iterating are test nodes, which
+        # already exist when filtered_nodes and nodes are the same dictionary (e.g. when using the dbt ls cache)
+        for node in self.nodes.values():
             if node.resource_type == DbtResourceType.TEST:
+                if not any(node_id in filtered_nodes for node_id in node.depends_on):
+                    continue
+                filtered_nodes[node.unique_id] = node
+                is_non_detached_test = len(node.depends_on) == 1 or not detach_multiple_parents_tests
                 for node_id in node.depends_on:
-                    if node_id in self.filtered_nodes:
-                        self.filtered_nodes[node_id].has_test = True
-                        self.filtered_nodes[node.unique_id] = node
-                        if (
-                            len(node.depends_on) == 1
-                            or self.render_config.should_detach_multiple_parents_tests is False
-                        ):
-                            self.filtered_nodes[node_id].has_non_detached_test = True
+                    non_detached_test_by_tested_node[node_id] = (
+                        non_detached_test_by_tested_node.get(node_id, False) or is_non_detached_test
+                    )
             else:
                 for parent_node_id in node.depends_on:
                     parent_node = self.nodes.get(parent_node_id)
                     if parent_node is not None:
                         parent_node.downstream.append(node.unique_id)
+
+        for node_id in non_detached_test_by_tested_node.keys() & filtered_nodes.keys():
+            tested_node = filtered_nodes[node_id]
+            tested_node.has_test = True
+            if non_detached_test_by_tested_node[node_id]:
+                tested_node.has_non_detached_test = True
@@ -11,6 +11,7 @@ from packaging.version import Version
 
 from cosmos.constants import (
     DEFAULT_COSMOS_CACHE_DIR_NAME,
+    DEFAULT_DBT_PROJECT_HASH_EXCLUDED_DIRS,
     DEFAULT_OPENLINEAGE_NAMESPACE,
 )
 
@@ -27,6 +28,14 @@ use_dataset_airflow3_uri_standard = conf.getboolean(
 enable_cache_partial_parse = conf.getboolean("cosmos", "enable_cache_partial_parse", fallback=True)
 enable_cache_package_lockfile = conf.getboolean("cosmos", "enable_cache_package_lockfile", fallback=True)
 enable_cache_dbt_ls = conf.getboolean("cosmos", "enable_cache_dbt_ls", fallback=True)
+# Directories, at the root of the dbt project, which are not taken into account when calculating the project hash
+dbt_project_hash_excluded_dirs = {
+    dir_name.strip()
+    for dir_name in conf.get(
+        "cosmos", "dbt_project_hash_excluded_dirs", fallback=DEFAULT_DBT_PROJECT_HASH_EXCLUDED_DIRS
+    ).split(",")
+    if dir_name.strip()
+}
 rich_logging = conf.getboolean("cosmos", "rich_logging", fallback=False)
 dbt_docs_dir = conf.get("cosmos", "dbt_docs_dir", fallback=None)
 dbt_docs_conn_id = conf.get("cosmos", "dbt_docs_conn_id", fallback=None)
@@ -1,40 +1,210 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import os
+import tempfile
+import time
+from collections.abc import Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from stat import S_ISDIR
 
+import msgpack
+
+from cosmos import settings
 from cosmos.log import get_logger
 
 logger = get_logger(__name__)
 
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+HASH_SMALL_FILE_SIZE = 8192
+HASH_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+HASH_INDEX_FILENAME_PREFIX = ".file_hash_index"
+# Files modified within this window may be modified again without changing their modification time, depending on the
+# file system timestamp granularity, so their digests are not reused
+HASH_RACY_WINDOW_NS = 2_000_000_000
+
+# Maps the relative path of a file to [st_mtime_ns, st_size, st_ino, digest]
+FileHashIndex = dict[str, list[int | bytes]]
+
+# Latest index calculated by the current process for each index path (or directory, if the index is not stored), so it
+# is not loaded from disk on every call
+_file_hash_indexes: dict[str, FileHashIndex] = {}
+
+
+def _iter_files(root_dir: str, excluded_dirs: Collection[str] = ()) -> Iterator[os.DirEntry[str]]:
+    """
+    Recursively yield the entry of every non-directory within the given directory, using ``os.scandir``.
+    The directories named in ``excluded_dirs``, placed directly in the given directory, are not entered.
 
-def _create_folder_version_hash(dir_path: Path) -> str:
+    Directories are identified using the type cached by ``os.scandir``, without an additional ``stat`` call.
+    Similar to ``os.walk``, symbolic links to directories are not followed. They are yielded, as the symbolic links
+    to files (including broken ones), and it is up to the caller to skip them.
+    """
+    stack = [root_dir]
+    while stack:
+        current_dir = stack.pop()
+        try:
+            entries = os.scandir(current_dir)
+        except OSError as e:
+            # Similar to os.walk, directories that cannot be listed (e.g. that do not exist) are skipped
+            logger.debug(f"Unable to list the directory {current_dir} due to {repr(e)}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if current_dir != root_dir or entry.name not in excluded_dirs:
+                        stack.append(entry.path)
+                else:
+                    yield entry
+
+
+def _hash_file(filepath: str, size: int) -> bytes | None:
+    """
+    Return the SHA-256 digest of the given file, or None if it does not exist.
+    Small files are read at once, while larger ones are read in fixed-size chunks.
+    """
+    try:
+        with open(filepath, "rb") as fp:
+            if size < HASH_SMALL_FILE_SIZE:
+                return hashlib.sha256(fp.read()).digest()
+            # Available from Python 3.11, it avoids the Python-level read/update loop
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(fp, "sha256").digest()
+            hasher = hashlib.sha256()
+            while buf := fp.read(HASH_CHUNK_SIZE):
+                hasher.update(buf)
+    except FileNotFoundError:
+        logger.warning(f"The dbt project folder contains a symbolic link to a non-existent file: {filepath}")
+        return None
+    return hasher.digest()
+
+
+def _get_hash_index_path(root_dir: str, index_dir: Path) -> Path:
+    """
+    Return the path of the file used to store the per-file digests of a given directory.
+    """
+    root_dir_hash = hashlib.md5(root_dir.encode()).hexdigest()
+    return index_dir / f"{HASH_INDEX_FILENAME_PREFIX}_{root_dir_hash}.msgpack"
+
+
+def _load_hash_index(index_path: Path) -> FileHashIndex:
+    """
+    Load the per-file digests previously stored in the given path. Return an empty index if it is unavailable.
+    """
+    try:
+        with index_path.open("rb") as fp:
+            index: FileHashIndex = msgpack.unpack(fp)
+    except (OSError, ValueError, msgpack.UnpackException) as e:
+        logger.debug(f"Unable to load the file hash index {index_path} due to {repr(e)}")
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _save_hash_index(index_path: Path, index: FileHashIndex) -> None:
+    """
+    Atomically store the per-file digests in the given path, so concurrent readers never see a partial file.
+    """
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=index_path.parent)
+        with os.fdopen(temp_fd, "wb") as fp:
+            fp.write(msgpack.packb(index))
+        os.replace(temp_path, index_path)
+    except OSError as e:
+        logger.debug(f"Unable to store the file hash index {index_path} due to {repr(e)}")
+
+
+def _hash_files(root_dir: str, previous_index: FileHashIndex, excluded_dirs: Collection[str]) -> FileHashIndex:
+    """
+    Calculate the digest of every file within the given directory, reusing the digests from the previous index
+    for the files whose modification time, size and inode did not change.
+    """
+    prefix_length = len(os.path.join(root_dir, ""))
+    racy_mtime_ns = time.time_ns() - HASH_RACY_WINDOW_NS
+    index: FileHashIndex = {}
+    pending = []
+
+    for entry in _iter_files(root_dir, excluded_dirs):
+        relative_path = entry.path[prefix_length:]
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            logger.warning(f"The dbt project folder contains a symbolic link to a non-existent file: {entry.path}")
+            continue
+        if S_ISDIR(stat.st_mode):
+            # Symbolic link to a directory
+            continue
+        # The inode changes when a file is atomically replaced (e.g. by rsync), even if it keeps the modification time
+        signature: list[int | bytes] = [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+        previous = previous_index.get(relative_path)
+        if previous is not None and previous[:-1] == signature:
+            index[relative_path] = previous
+        else:
+            if stat.st_mtime_ns >= racy_mtime_ns:
+                # Recorded with an invalid modification time, so the file is hashed again in the next call
+                signature[0] = -1
+            pending.append((relative_path, entry.path, stat.st_size, signature))
+
+    # Large files are hashed concurrently, since this is mostly I/O bound. Meanwhile, small files (the majority of
+    # dbt project files) are hashed sequentially in this thread, since dispatching them would cost more than hashing.
+    small_files = [item for item in pending if item[2] < HASH_SMALL_FILE_SIZE]
+    large_files = [item for item in pending if item[2] >= HASH_SMALL_FILE_SIZE]
+    with ThreadPoolExecutor(max_workers=HASH_MAX_WORKERS) as executor:
+        large_files_digests = executor.map(
+            _hash_file, [filepath for _, filepath, _, _ in large_files], [size for _, _, size, _ in large_files]
+        )
+        small_files_digests = [_hash_file(filepath, size) for _, filepath, size, _ in small_files]
+        for (relative_path, _, _, signature), digest in zip(
+            small_files + large_files, itertools.chain(small_files_digests, large_files_digests)
+        ):
+            if digest is not None:
+                index[relative_path] = signature + [digest]
+
+    return index
+
+
+def _create_folder_version_hash(
+    dir_path: Path, index_dir: Path | None = None, excluded_dirs: Collection[str] | None = None
+) -> str:
     """
     Given a directory, iterate through its content and create a hash that will change in case the
     contents of the directory change. The value should not change if the values of the directory do not change, even if
     the command is run from different Airflow instances.
 
     This method output must be concise and it currently changes based on operating system.
+
+    :param dir_path: Directory to be hashed
+    :param index_dir: (optional) Directory used to store the digest of each file, so unchanged files (same
+        modification time, size and inode) are not read again in subsequent calls, including from other processes.
+        Within the same process, the digests calculated by the previous call are reused regardless
+    :param excluded_dirs: (optional) Names of the directories, within ``dir_path``, to be ignored. By default, these
+        are the generated directories defined in ``settings.dbt_project_hash_excluded_dirs`` (e.g. ``target``)
     """
     # This approach is less efficient than using modified time
     # sum([path.stat().st_mtime for path in dir_path.glob("**/*")])
     # unfortunately, the modified time approach does not work well for dag-only deployments
-    # where DAGs are constantly synced to the deployed Airflow
-    # for 5k files, this seems to take 0.14
-    hasher = hashlib.md5()
-    filepaths = []
+    # where DAGs are constantly synced to the deployed Airflow. The modified time, size and inode are only used
+    # to decide if a file content needs to be hashed again.
+    root_dir = str(dir_path)
+    if excluded_dirs is None:
+        excluded_dirs = settings.dbt_project_hash_excluded_dirs
+    index_path = _get_hash_index_path(root_dir, index_dir) if index_dir is not None else None
+    memo_key = str(index_path) if index_path is not None else root_dir
+    previous_index = _file_hash_indexes.get(memo_key)
+    if previous_index is None:
+        previous_index = _load_hash_index(index_path) if index_path is not None else {}
 
-    for root_dir, dirs, files in os.walk(dir_path):
-        paths = [os.path.join(root_dir, filepath) for filepath in files]
-        filepaths.extend(paths)
+    index = _hash_files(root_dir, previous_index, excluded_dirs)
+    _file_hash_indexes[memo_key] = index
 
-    for filepath in sorted(filepaths):
-        try:
-            with open(str(filepath), "rb") as fp:
-                buf = fp.read()
-                hasher.update(buf)
-        except FileNotFoundError:
-            logger.warning(f"The dbt project folder contains a symbolic link to a non-existent file: {filepath}")
+    if index_path is not None and index != previous_index:
+        _save_hash_index(index_path, index)
+
+    hasher = hashlib.sha256()
+    for relative_path in sorted(index):
+        hasher.update(relative_path.encode())
+        hasher.update(index[relative_path][-1])  # type: ignore[arg-type]
 
     return hasher.hexdigest()
@@ -1,11 +1,15 @@
 import base64
+import gc
 import importlib
+import io
 import json
 import logging
+import math
 import os
 import shutil
 import sys
 import tempfile
+import weakref
 import zlib
 from datetime import datetime
 from pathlib import Path
@@ -32,6 +36,7 @@ from cosmos.dbt.graph import (
     DbtGraph,
     DbtNode,
     LoadMode,
+    _load_json_file,
     _normalize_path,
     parse_dbt_ls_output,
     run_command,
@@ -1327,6 +1332,23 @@ def test_run_command_success_with_log(tmp_dbt_project_dir):
     assert "Installing dbt-labs/dbt_utils" in response
 
 
+@pytest.mark.parametrize("log_level,is_logged", [(logging.DEBUG, True), (logging.INFO, False)])
+@patch("cosmos.dbt.graph.run_command_with_subprocess", return_value="")
+def test_run_command_logs_dbt_log_file_only_in_debug(mock_subprocess, log_level, is_logged, tmp_path, caplog):
+    caplog.set_level(log_level)
+    (tmp_path / DBT_LOG_FILENAME).write_text("some dbt log line\n")
+    with patch("cosmos.dbt.graph.open", create=True, side_effect=open) as mock_open:
+        run_command(
+            command=["dbt", "ls"],
+            env_vars={},
+            tmp_dir=tmp_path,
+            invocation_mode=InvocationMode.SUBPROCESS,
+            log_dir=tmp_path,
+        )
+    assert mock_open.called is is_logged
+    assert ("some dbt log line" in caplog.text) is is_logged
+
+
 @patch("cosmos.dbt.graph.run_command_with_subprocess")
 @patch("cosmos.dbt.graph.run_command_with_dbt_runner")
 def test_run_command_forcing_subprocess(mock_dbt_runner, mock_subprocess, tmp_dbt_project_dir):
@@ -1499,6 +1521,57 @@ def test_parse_dbt_ls_output_with_json_without_tags_or_config():
     assert expected_nodes == nodes
 
 
+def test_parse_dbt_ls_output_skips_log_lines(caplog):
+    caplog.set_level(logging.DEBUG)
+    some_ls_stdout = """12:00:00  Running with dbt=1.9.0
+[1, 2]
+{not json}
+  {"resource_type": "model", "package_name": "some-project", "original_file_path": "some-file-path.sql", "unique_id": "some-unique-id"}\r
+"""
+
+    nodes = parse_dbt_ls_output(Path("some-project"), some_ls_stdout)
+
+    assert list(nodes) == ["some-unique-id"]
+    assert nodes["some-unique-id"].resource_type == DbtResourceType.MODEL
+    assert "Skipped dbt ls line: 12:00:00  Running with dbt=1.9.0" in caplog.text
+    assert "Skipped dbt ls line: {not json}" in caplog.text
+
+
+def test_parse_dbt_ls_output_with_nan_values():
+    # Valid for the standard library json module, which dbt uses, but not for orjson
+    some_ls_stdout = """{"resource_type": "model", "original_file_path": "a.sql", "unique_id": "model.a"}
+{"resource_type": "model", "original_file_path": "b.sql", "unique_id": "model.b", "config": {"meta": {"x": NaN}}}
+{"resource_type": "model", "original_file_path": "c.sql", "unique_id": "model.c"}"""
+
+    nodes = parse_dbt_ls_output(Path("some-project"), some_ls_stdout)
+
+    assert list(nodes) == ["model.a", "model.b", "model.c"]
+    assert math.isnan(nodes["model.b"].config["meta"]["x"])
+
+
+def test_parse_dbt_ls_output_skips_lines_with_multiple_json_objects():
+    # Once joined into a JSON array, the first line would be parsed as two nodes
+    some_ls_stdout = """{"resource_type": "model", "original_file_path": "a.sql", "unique_id": "model.a"}, {"b": 1}
+{"resource_type": "model", "original_file_path": "c.sql", "unique_id": "model.c"}"""
+
+    nodes = parse_dbt_ls_output(Path("some-project"), some_ls_stdout)
+
+    assert list(nodes) == ["model.c"]
+
+
+def test_parse_dbt_ls_output_with_line_boundary_characters_in_values():
+    # Unlike "\n", these characters may be written unescaped within the JSON values of a dbt ls line
+    some_ls_stdout = "\n".join(
+        f'{{"resource_type": "model", "original_file_path": "{i}.sql", "unique_id": "model.{i}", "config": {{"meta": {{"key": "a{char}b"}}}}}}'
+        for i, char in enumerate(["\x85", "\u2028"])
+    )
+
+    nodes = parse_dbt_ls_output(Path("some-project"), some_ls_stdout)
+
+    assert list(nodes) == ["model.0", "model.1"]
+    assert nodes["model.0"].config["meta"] == {"key": "a\x85b"}
+
+
 @patch("cosmos.dbt.graph.DbtGraph.should_use_dbt_ls_cache", return_value=False)
 @patch("cosmos.dbt.graph.Popen")
 @patch("cosmos.dbt.graph.DbtGraph.update_node_dependency")
@@ -1909,6 +1982,27 @@ def test_dbt_ls_cache_key_args_uses_airflow_vars_to_purge_dbt_ls_cache(airflow_v
     assert graph.dbt_ls_cache_key_args == [key, value]
 
 
+@patch("cosmos.dbt.graph.Variable.get", return_value="some-value")
+def test_dbt_ls_cache_key_args_retrieves_each_airflow_var_once(mock_variable_get):
+    graph = DbtGraph(
+        project=ProjectConfig(),
+        render_config=RenderConfig(
+            airflow_vars_to_purge_dbt_ls_cache=["some_var", "other_var", "some_var"],
+            source_rendering_behavior=SOURCE_RENDERING_BEHAVIOR,
+        ),
+    )
+    assert graph.dbt_ls_cache_key_args == [
+        "some_var",
+        "some-value",
+        "other_var",
+        "some-value",
+        "some_var",
+        "some-value",
+    ]
+    assert mock_variable_get.call_count == 2
+
+
+@patch("cosmos.dbt.graph.zstandard", None)
 @patch("cosmos.dbt.graph.datetime")
 @patch("cosmos.dbt.graph.Variable.set")
 def test_save_dbt_ls_cache(mock_variable_set, mock_datetime, tmp_dbt_project_dir):
@@ -1918,15 +2012,28 @@ def test_save_dbt_ls_cache(mock_variable_set, mock_datetime, tmp_dbt_project_dir
     graph.save_dbt_ls_cache(dbt_ls_output)
     assert mock_variable_set.call_args[0][0] == "cosmos_cache__something"
     assert mock_variable_set.call_args[0][1]["dbt_ls_compressed"] == "eJwrzs9NVcgvLSkoLQEAGpAEhg=="
+    assert "dbt_ls_compressed_zstd" not in mock_variable_set.call_args[0][1]
     assert mock_variable_set.call_args[0][1]["last_modified"] == "2022-01-01T12:00:00"
     version = mock_variable_set.call_args[0][1].get("version")
     hash_dir, hash_args = version.split(",")
     assert hash_args == "d41d8cd98f00b204e9800998ecf8427e"
-    if sys.platform == "darwin":
-        # We faced inconsistent hashing versions depending on the version of MacOS/Linux - the following line aims to address these.
-        assert hash_dir in ("7abb868ed1c22e78de1c00429d950a77", "85cba4ef17dd7c161938da6980a6ff85")
-    else:
-        assert hash_dir == "85cba4ef17dd7c161938da6980a6ff85"
+    # Files are hashed in the order of their relative paths, so the value is the same on Linux and MacOS
+    assert hash_dir == "a1faabfe16821425b160562c41ebe2e7c5a4d400a7d6d2e86655de8b4dff0e11"
+
+
+@patch("cosmos.dbt.graph.Variable.set")
+@patch("cosmos.dbt.graph.Variable.get", return_value={"version": "old-version"})
+@patch("cosmos.dbt.graph.cache._calculate_dbt_ls_cache_current_version", return_value="new-version")
+@patch("cosmos.dbt.graph.DbtGraph.should_use_dbt_ls_cache", return_value=True)
+def test_load_and_save_dbt_ls_cache_calculate_the_version_once(
+    mock_should_use_dbt_ls_cache, mock_calculate_current_version, mock_variable_get, mock_variable_set
+):
+    graph = DbtGraph(cache_identifier="something", project=ProjectConfig(dbt_project_path="/tmp"))
+    assert not graph.load_via_dbt_ls_cache()
+    graph.save_dbt_ls_cache("some output")
+
+    assert mock_variable_set.call_args[0][1]["version"] == "new-version"
+    mock_calculate_current_version.assert_called_once()
 
 
 @pytest.mark.integration
@@ -1941,6 +2048,51 @@ def test_get_dbt_ls_cache_returns_decoded_and_decompressed_value(mock_variable_g
     assert graph.get_dbt_ls_cache() == {"dbt_ls": "some output"}
 
 
+@patch("cosmos.dbt.graph.Variable.set")
+def test_save_and_get_dbt_ls_cache_with_zstd(mock_variable_set, tmp_dbt_project_dir):
+    pytest.importorskip("zstandard")
+    graph = DbtGraph(cache_identifier="something", project=ProjectConfig(dbt_project_path=tmp_dbt_project_dir))
+    graph.save_dbt_ls_cache("some output")
+    cache_dict = mock_variable_set.call_args[0][1]
+    assert "dbt_ls_compressed" not in cache_dict
+    assert cache_dict["dbt_ls_compressed_zstd"]
+
+    with patch("cosmos.dbt.graph.Variable.get", return_value=cache_dict):
+        assert graph.get_dbt_ls_cache()["dbt_ls"] == "some output"
+
+
+@patch("cosmos.dbt.graph.zstandard", None)
+@patch(
+    "cosmos.dbt.graph.Variable.get",
+    return_value={"dbt_ls_compressed_zstd": "KLUv/SALWQAAc29tZSBvdXRwdXQ=", "version": "some-version"},
+)
+def test_get_dbt_ls_cache_without_zstandard_ignores_zstd_value(mock_variable_get):
+    graph = DbtGraph(project=ProjectConfig())
+    assert graph.get_dbt_ls_cache() == {"version": "some-version"}
+
+
+@pytest.mark.parametrize("zstandard_installed", [True, False])
+@patch("cosmos.dbt.graph.Variable.set")
+def test_save_dbt_ls_cache_is_readable_by_zlib_only_versions(
+    mock_variable_set, zstandard_installed, tmp_dbt_project_dir
+):
+    mock_zstandard = MagicMock() if zstandard_installed else None
+    if mock_zstandard is not None:
+        mock_zstandard.ZstdCompressor.return_value.compress.return_value = b"zstd compressed output"
+    graph = DbtGraph(cache_identifier="something", project=ProjectConfig(dbt_project_path=tmp_dbt_project_dir))
+    with patch("cosmos.dbt.graph.zstandard", mock_zstandard):
+        graph.save_dbt_ls_cache("some output")
+    cache_dict = mock_variable_set.call_args[0][1]
+
+    # Cosmos versions without zstd support decompress this value using zlib, if it is present, and otherwise
+    # consider it a cache miss
+    dbt_ls_compressed = cache_dict.get("dbt_ls_compressed")
+    if zstandard_installed:
+        assert dbt_ls_compressed is None
+    else:
+        assert zlib.decompress(base64.b64decode(dbt_ls_compressed.encode())).decode("utf-8") == "some output"
+
+
 @patch("cosmos.dbt.graph.Variable.get", return_value={})
 def test_get_dbt_ls_cache_returns_empty_dict_if_empty_dict_var(mock_variable_get):
     graph = DbtGraph(project=ProjectConfig())
@@ -1994,7 +2146,13 @@ def test_load_via_dbt_ls_cache_is_false_if_cache_is_outdated(
     assert mock_calculate_current_version.called
 
 
-@patch("cosmos.dbt.graph.parse_dbt_ls_output", return_value={"some-node": {}})
+SOME_DBT_NODE = DbtNode(
+    unique_id="some-node", resource_type=DbtResourceType.MODEL, depends_on=[], file_path=Path("/tmp/some-node.sql")
+)
+
+
+@patch.dict("cosmos.dbt.graph._parsed_dbt_ls_cache", clear=True)
+@patch("cosmos.dbt.graph.parse_dbt_ls_output", return_value={"some-node": SOME_DBT_NODE})
 @patch("cosmos.dbt.graph.cache._calculate_dbt_ls_cache_current_version", return_value=1)
 @patch("cosmos.dbt.graph.DbtGraph.get_dbt_ls_cache", return_value={"version": 1, "dbt_ls": "output"})
 @patch("cosmos.dbt.graph.DbtGraph.should_use_dbt_ls_cache", return_value=True)
@@ -2004,14 +2162,35 @@ def test_load_via_dbt_ls_cache_is_true(
     graph = DbtGraph(project=ProjectConfig(dbt_project_path="/tmp"))
     assert graph.load_via_dbt_ls_cache()
     assert graph.load_method == LoadMode.DBT_LS_CACHE
-    assert graph.nodes == {"some-node": {}}
-    assert graph.filtered_nodes == {"some-node": {}}
+    assert graph.nodes == {"some-node": SOME_DBT_NODE}
+    assert graph.filtered_nodes == {"some-node": SOME_DBT_NODE}
     assert mock_should_use_dbt_ls_cache.called
     assert mock_get_dbt_ls_cache.called
     assert mock_calculate_current_version.called
     assert mock_parse_dbt_ls_output.called
 
 
+@patch.dict("cosmos.dbt.graph._parsed_dbt_ls_cache", clear=True)
+@patch("cosmos.dbt.graph.parse_dbt_ls_output", return_value={"some-node": SOME_DBT_NODE})
+@patch("cosmos.dbt.graph.cache._calculate_dbt_ls_cache_current_version", return_value=1)
+@patch("cosmos.dbt.graph.DbtGraph.get_dbt_ls_cache", return_value={"version": 1, "dbt_ls": "output"})
+@patch("cosmos.dbt.graph.DbtGraph.should_use_dbt_ls_cache", return_value=True)
+def test_load_via_dbt_ls_cache_reuses_parsed_nodes(
+    mock_should_use_dbt_ls_cache, mock_get_dbt_ls_cache, mock_calculate_current_version, mock_parse_dbt_ls_output
+):
+    graph = DbtGraph(project=ProjectConfig(dbt_project_path="/tmp"))
+    assert graph.load_via_dbt_ls_cache()
+    graph.nodes["some-node"].downstream.append("other-node")
+
+    other_graph = DbtGraph(project=ProjectConfig(dbt_project_path="/tmp"))
+    assert other_graph.load_via_dbt_ls_cache()
+
+    assert mock_parse_dbt_ls_output.call_count == 1
+    assert other_graph.nodes == {"some-node": SOME_DBT_NODE}
+    assert other_graph.nodes["some-node"] is not graph.nodes["some-node"]
+    assert other_graph.nodes["some-node"].downstream == []
+
+
 @pytest.mark.parametrize(
     "enable_cache,enable_cache_dbt_ls,cache_id,should_use",
     [
@@ -2032,10 +2211,18 @@ def test_should_use_dbt_ls_cache(enable_cache, enable_cache_dbt_ls, cache_id, sh
     ):
         importlib.reload(settings)
         graph = DbtGraph(cache_identifier=cache_id, project=ProjectConfig(dbt_project_path="/tmp"))
-        graph.should_use_dbt_ls_cache.cache_clear()
         assert graph.should_use_dbt_ls_cache() == should_use
 
 
+def test_should_use_dbt_ls_cache_does_not_keep_graph_alive():
+    graph = DbtGraph(cache_identifier="id", project=ProjectConfig(dbt_project_path="/tmp"))
+    graph.should_use_dbt_ls_cache()
+    graph_ref = weakref.ref(graph)
+    del graph
+    gc.collect()
+    assert graph_ref() is None
+
+
 @pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
 @patch(object_storage_path)
 @patch("cosmos.config.ProjectConfig")
@@ -2098,6 +2285,35 @@ def test_get_dbt_ls_cache_remote_cache_dir(
     assert result == expected_result
 
 
+def test_load_json_file(tmp_path):
+    json_path = tmp_path / "manifest.json"
+    json_path.write_text('{"nodes": {"model.a": {}}}')
+    assert _load_json_file(json_path) == {"nodes": {"model.a": {}}}
+
+
+def test_load_json_file_with_nan(tmp_path):
+    # dbt writes its artifacts using json.dumps, which allows NaN values, unlike orjson
+    json_path = tmp_path / "manifest.json"
+    json_path.write_text('{"nodes": {"model.p.a": {"meta": {"x": NaN}}}}')
+    value = _load_json_file(json_path)["nodes"]["model.p.a"]["meta"]["x"]
+    assert math.isnan(value)
+
+
+def test_load_json_file_without_file_descriptor():
+    # Files of remote storages (e.g. ObjectStoragePath) cannot be memory-mapped
+    remote_path = MagicMock()
+    remote_path.open.return_value = io.BytesIO(b'{"nodes": {"model.a": {}}}')
+    assert _load_json_file(remote_path) == {"nodes": {"model.a": {}}}
+
+
+@patch("cosmos.dbt.graph.ORJSON_AVAILABLE", False)
+@patch("cosmos.dbt.graph._json_loads", json.loads)
+def test_load_json_file_without_orjson(tmp_path):
+    json_path = tmp_path / "manifest.json"
+    json_path.write_text('{"nodes": {"model.a": {}}}')
+    assert _load_json_file(json_path) == {"nodes": {"model.a": {}}}
+
+
 def test__normalize_path():
     """
     This normalizes the path (e.g. declared inside a manifest.json file) when it was created using MS Windows instead
@@ -11,13 +11,14 @@ if version.parse(airflow_version).major >= _AIRFLOW3_MAJOR_VERSION:
     pytest.skip("Skipping Cache tests on Airflow 3.0+", allow_module_level=True)
 
 import logging
-import shutil
+import sys
 import tempfile
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
+import msgpack
 import pytest
 from airflow import DAG
 from airflow.models import DagRun, Variable
@@ -26,6 +27,7 @@ from airflow.utils.task_group import TaskGroup
 
 from cosmos.cache import (
     _configure_remote_cache_dir,
+    _copy_file,
     _copy_partial_parse_to_project,
     _create_cache_identifier,
     _get_latest_cached_package_lockfile,
@@ -38,6 +40,7 @@ from cosmos.cache import (
     get_cached_profile,
     is_cache_package_lockfile_enabled,
     is_profile_cache_enabled,
+    patch_partial_parse_content,
 )
 from cosmos.constants import (
     DBT_PARTIAL_PARSE_FILE_NAME,
@@ -52,8 +55,6 @@ START_DATE = datetime(2024, 4, 16)
 example_dag = DAG("dag", start_date=START_DATE)
 example_dag_with_dots = DAG("dag.with.dots", start_date=START_DATE)
 
-SAMPLE_PARTIAL_PARSE_FILEPATH = Path(__file__).parent / "sample/partial_parse.msgpack"
-
 
 @pytest.mark.parametrize(
     "dag, task_group, result_identifier",
@@ -110,13 +111,14 @@ def test_get_latest_partial_parse(tmp_path):
     assert _get_latest_partial_parse(tmp_path, tmp_path) is None
 
 
-@patch("cosmos.cache.msgpack.unpack", side_effect=ValueError)
+@patch("cosmos.cache.msgpack.unpackb", side_effect=ValueError)
 def test__copy_partial_parse_to_project_msg_fails_msgpack(mock_unpack, tmp_path, caplog):
     caplog.set_level(logging.INFO)
     source_dir = tmp_path / DBT_TARGET_DIR_NAME
     source_dir.mkdir()
     partial_parse_filepath = source_dir / DBT_PARTIAL_PARSE_FILE_NAME
-    shutil.copy(str(SAMPLE_PARTIAL_PARSE_FILEPATH), str(partial_parse_filepath))
+    # The file is memory-mapped before being decoded, so it cannot be empty
+    partial_parse_filepath.write_bytes(msgpack.packb({"nodes": {"model.a": {"root_path": "/non-existent/path"}}}))
 
     # actual test
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -125,6 +127,27 @@ def test__copy_partial_parse_to_project_msg_fails_msgpack(mock_unpack, tmp_path,
     assert "Unable to patch the partial_parse.msgpack file due to ValueError()" in caplog.text
 
 
+@pytest.mark.parametrize(
+    "root_path,should_patch",
+    [(None, False), ("", False), ("existing", False), ("/non-existent/path", True)],
+)
+def test_patch_partial_parse_content(root_path, should_patch, tmp_path):
+    if root_path == "existing":
+        root_path = str(tmp_path)
+    node = {} if root_path is None else {"root_path": root_path}
+    partial_parse_filepath = tmp_path / DBT_PARTIAL_PARSE_FILE_NAME
+    partial_parse_filepath.write_bytes(msgpack.packb({"nodes": {"model.a": node}}))
+
+    with patch("cosmos.cache.msgpack.unpackb", wraps=msgpack.unpackb) as mock_unpackb:
+        assert patch_partial_parse_content(partial_parse_filepath, tmp_path) is should_patch
+
+    # The content is only fully decoded if the first root_path is stale
+    assert mock_unpackb.called is should_patch
+    if should_patch:
+        data = msgpack.unpackb(partial_parse_filepath.read_bytes())
+        assert data["nodes"]["model.a"]["root_path"] == str(tmp_path)
+
+
 @patch("cosmos.cache.shutil.copyfile")
 @patch("cosmos.cache.get_partial_parse_path")
 def test_update_partial_parse_cache(mock_get_partial_parse_path, mock_copyfile):
@@ -147,6 +170,28 @@ def test_update_partial_parse_cache(mock_get_partial_parse_path, mock_copyfile):
     mock_copyfile.assert_has_calls(calls)
 
 
+def test_copy_file(tmp_path):
+    source_filepath = tmp_path / "source.json"
+    source_filepath.write_text('{"nodes": {}}')
+    target_filepath = tmp_path / "target.json"
+
+    _copy_file(str(source_filepath), str(target_filepath))
+
+    assert target_filepath.read_text() == '{"nodes": {}}'
+
+
+@patch("cosmos.cache.sys.platform", "win32")
+@patch.dict(sys.modules, {"fcntl": None})
+def test_copy_file_without_fcntl(tmp_path):
+    source_filepath = tmp_path / "source.json"
+    source_filepath.write_text('{"nodes": {}}')
+    target_filepath = tmp_path / "target.json"
+
+    _copy_file(str(source_filepath), str(target_filepath))
+
+    assert target_filepath.read_text() == '{"nodes": {}}'
+
+
 @pytest.fixture
 def vars_session():
     with create_session() as session:
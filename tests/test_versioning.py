@@ -1,5 +1,7 @@
 import logging
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 from cosmos.versioning import _create_folder_version_hash
 
@@ -34,3 +36,115 @@ def test__create_folder_version_hash(tmp_path, caplog):
     file_1.unlink()
 
     _create_folder_version_hash(target_dir)
+
+
+def test__create_folder_version_hash_of_non_existent_folder(tmp_path):
+    assert _create_folder_version_hash(tmp_path / "non-existent") == _create_folder_version_hash(tmp_path)
+
+
+def test__create_folder_version_hash_changes_with_contents(tmp_path):
+    (tmp_path / "models").mkdir()
+    model = tmp_path / "models" / "model.sql"
+    model.write_text("select 1")
+    (tmp_path / "dbt_project.yml").write_text("name: project")
+
+    original_hash = _create_folder_version_hash(tmp_path)
+    assert _create_folder_version_hash(tmp_path) == original_hash
+
+    model.write_text("select 2")
+    modified_hash = _create_folder_version_hash(tmp_path)
+    assert modified_hash != original_hash
+
+    model.rename(tmp_path / "models" / "renamed_model.sql")
+    assert _create_folder_version_hash(tmp_path) != modified_hash
+
+
+def test__create_folder_version_hash_reuses_index(tmp_path):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    model = project_dir / "model.sql"
+    model.write_text("select 1")
+    # The digests of recently modified files are not reused
+    os.utime(model, (1700000000, 1700000000))
+    index_dir = tmp_path / "cache"
+
+    original_hash = _create_folder_version_hash(project_dir)
+    assert _create_folder_version_hash(project_dir, index_dir=index_dir) == original_hash
+    assert len(list(index_dir.glob(".file_hash_index_*.msgpack"))) == 1
+
+    with patch("cosmos.versioning._hash_file") as mock_hash_file:
+        assert _create_folder_version_hash(project_dir, index_dir=index_dir) == original_hash
+    mock_hash_file.assert_not_called()
+
+    model.write_text("select 22")
+    assert _create_folder_version_hash(project_dir, index_dir=index_dir) != original_hash
+
+
+def test__create_folder_version_hash_reuses_digests_within_the_process(tmp_path):
+    model = tmp_path / "model.sql"
+    model.write_text("select 1")
+    os.utime(model, (1700000000, 1700000000))
+    original_hash = _create_folder_version_hash(tmp_path)
+
+    with patch("cosmos.versioning._hash_file") as mock_hash_file:
+        assert _create_folder_version_hash(tmp_path) == original_hash
+    mock_hash_file.assert_not_called()
+
+
+def test__create_folder_version_hash_rehashes_recently_modified_files(tmp_path):
+    model = tmp_path / "model.sql"
+    model.write_text("select 1")
+    original_hash = _create_folder_version_hash(tmp_path)
+
+    # Same size and, depending on the file system timestamp granularity, same modification time
+    model_stat = model.stat()
+    model.write_text("select 2")
+    os.utime(model, ns=(model_stat.st_atime_ns, model_stat.st_mtime_ns))
+    assert _create_folder_version_hash(tmp_path) != original_hash
+
+
+def test__create_folder_version_hash_does_not_follow_directory_symlinks(tmp_path):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "model.sql").write_text("select 1")
+    original_hash = _create_folder_version_hash(project_dir)
+
+    external_dir = tmp_path / "external"
+    external_dir.mkdir()
+    (external_dir / "other_model.sql").write_text("select 2")
+    (project_dir / "external").symlink_to(external_dir, target_is_directory=True)
+
+    assert _create_folder_version_hash(project_dir) == original_hash
+
+
+def test__create_folder_version_hash_rehashes_replaced_files(tmp_path):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    model = project_dir / "model.sql"
+    model.write_text("select 1")
+    index_dir = tmp_path / "cache"
+    original_hash = _create_folder_version_hash(project_dir, index_dir=index_dir)
+
+    # Atomically replace the file with another one with the same size and modification time
+    replacement = tmp_path / "replacement.sql"
+    replacement.write_text("select 2")
+    model_stat = model.stat()
+    os.utime(replacement, ns=(model_stat.st_atime_ns, model_stat.st_mtime_ns))
+    replacement.replace(model)
+
+    assert _create_folder_version_hash(project_dir, index_dir=index_dir) != original_hash
+
+
+def test__create_folder_version_hash_ignores_excluded_dirs(tmp_path):
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "model.sql").write_text("select 1")
+    original_hash = _create_folder_version_hash(tmp_path, excluded_dirs={"target"})
+
+    (tmp_path / "target").mkdir()
+    (tmp_path / "target" / "manifest.json").write_text("{}")
+    assert _create_folder_version_hash(tmp_path, excluded_dirs={"target"}) == original_hash
+
+    # Only directories at the root of the project are excluded
+    (tmp_path / "models" / "target").mkdir()
+    (tmp_path / "models" / "target" / "other_model.sql").write_text("select 2")
+    assert _create_folder_version_hash(tmp_path, excluded_dirs={"target"}) != original_hash